@@ -49,6 +49,13 @@ function M.check()
     end
   end
 
+  vim.fn.system(string.format(check_module, "orjson"))
+  if vim.v.shell_error == 0 then
+    ok("orjson is installed")
+  else
+    warn("orjson not found (optional, using json)")
+  end
+
   local plugin_path = gdocs.get_plugin_path()
   local rpc = require("gdocs.rpc")
 
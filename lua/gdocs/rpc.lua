@@ -32,6 +32,7 @@ function M.start_server()
     end,
     on_exit = function(_, code)
       M._job = nil
+      M._buffer = ""
       if code ~= 0 then
         get_gdocs().notify("Server exited with code: " .. code, vim.log.levels.WARN)
       end
@@ -61,18 +62,30 @@ function M._on_stdout(data)
     return
   end
 
-  for i, chunk in ipairs(data) do
-    if chunk ~= "" then
-      local ok, response = pcall(vim.json.decode, chunk)
+  M._buffer = M._buffer .. table.concat(data, "\n")
+
+  while true do
+    local header_end = M._buffer:find("\r\n\r\n", 1, true)
+    if not header_end then
+      return
+    end
+
+    local length = tonumber(M._buffer:sub(1, header_end - 1):match("Content%-Length:%s*(%d+)"))
+    local body_start = header_end + 4
+
+    if not length then
+      M._buffer = M._buffer:sub(body_start)
+    else
+      if #M._buffer < body_start + length - 1 then
+        return
+      end
+
+      local body = M._buffer:sub(body_start, body_start + length - 1)
+      M._buffer = M._buffer:sub(body_start + length)
+
+      local ok, response = pcall(vim.json.decode, body)
       if ok and response then
         M._handle_response(response)
-      else
-        M._buffer = M._buffer .. chunk
-        ok, response = pcall(vim.json.decode, M._buffer)
-        if ok and response then
-          M._handle_response(response)
-          M._buffer = ""
-        end
       end
     end
   end
@@ -113,7 +126,7 @@ function M.call(method, params, callback)
     M._pending[id] = callback
   end
 
-  vim.fn.chansend(M._job, request .. "\n")
+  vim.fn.chansend(M._job, "Content-Length: " .. #request .. "\r\n\r\n" .. request)
 end
 
 function M.call_sync(method, params, timeout_ms)
@@ -37,32 +37,87 @@ warnings.filterwarnings("ignore", category=FutureWarning)
 
 import json
 import re
+import threading
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Optional
 
 try:
     from google.auth.transport.requests import Request
+    from google_auth_httplib2 import AuthorizedHttp
     from google.oauth2.credentials import Credentials
     from google_auth_oauthlib.flow import InstalledAppFlow
     from googleapiclient.discovery import build
     from googleapiclient.errors import HttpError
+    from googleapiclient.http import build_http
 except ImportError as e:
     err_msg = f"Missing dependencies: {e}. Python: {sys.executable}, HOME: {os.environ.get('HOME', 'NOT SET')}, Path: {sys.path[:3]}"
     print(err_msg, file=sys.stderr)
-    sys.stdout.write(json.dumps({
+    body = json.dumps({
         "id": None,
         "error": {"code": -32603, "message": err_msg}
-    }) + "\n")
-    sys.stdout.flush()
+    }).encode("utf-8")
+    sys.stdout.buffer.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+    sys.stdout.buffer.flush()
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 SCOPES = [
     'https://www.googleapis.com/auth/documents',
     'https://www.googleapis.com/auth/drive.readonly'
 ]
 
+MAX_BATCH_SIZE = 20
+
 DATA_DIR = Path(os.environ.get('XDG_DATA_HOME', Path.home() / '.local/share')) / 'nvim' / 'gdocs'
 
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*)$')
+_BULLET_RE = re.compile(r'^(\s*)[-*]\s+(.*)$')
+_NUMBERED_RE = re.compile(r'^(\s*)\d+\.\s+(.*)$')
+_INLINE_DELIMS = frozenset('*~[')
+
+_HEADING_PREFIX = {
+    'HEADING_1': '# ',
+    'HEADING_2': '## ',
+    'HEADING_3': '### ',
+    'HEADING_4': '#### ',
+    'HEADING_5': '##### ',
+    'HEADING_6': '###### ',
+    'TITLE': '# ',
+    'SUBTITLE': '## ',
+}
+
+_ORDERED_GLYPHS = frozenset({'DECIMAL', 'ALPHA', 'ROMAN'})
+
+_PIPE_ESCAPE = str.maketrans({'|': '\\|', '\n': ' '})
+
+_PARSE_ERROR_RESPONSE = {
+    'id': None,
+    'error': {'code': -32700, 'message': 'Parse error'}
+}
+
+_STYLE_FIELDS = {
+    'bold': ('bold', True),
+    'italic': ('italic', True),
+    'strikethrough': ('strikethrough', True),
+}
+
+
+def _json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 
 class GoogleDocsClient:
 
@@ -70,6 +125,8 @@ class GoogleDocsClient:
         self.creds: Optional[Credentials] = None
         self.docs_service = None
         self.drive_service = None
+        self._http = None
+        self._auth_lock = threading.RLock()
         self._ensure_data_dir()
 
     def _ensure_data_dir(self):
@@ -84,12 +141,21 @@ class GoogleDocsClient:
         return DATA_DIR / 'token.json'
 
     def is_authenticated(self) -> bool:
-        self._load_credentials()
-        return self.creds is not None and self.creds.valid
+        with self._auth_lock:
+            self._load_credentials()
+            return self.creds is not None and self.creds.valid
 
     def _load_credentials(self):
-        if self.token_path.exists():
+        if self.creds and not self.creds.expired:
+            return
+
+        if self.creds and not self.creds.refresh_token:
+            self.creds = None
+
+        if not self.creds and self.token_path.exists():
             self.creds = Credentials.from_authorized_user_file(str(self.token_path), SCOPES)
+            self.docs_service = None
+            self.drive_service = None
 
         if self.creds and self.creds.expired and self.creds.refresh_token:
             try:
@@ -114,25 +180,36 @@ class GoogleDocsClient:
             flow = InstalledAppFlow.from_client_secrets_file(
                 str(self.credentials_path), SCOPES
             )
-            self.creds = flow.run_local_server(port=0)
-            self._save_credentials()
-            self._init_services()
+            creds = flow.run_local_server(port=0)
+            with self._auth_lock:
+                self.creds = creds
+                self._save_credentials()
+                self.docs_service = None
+                self.drive_service = None
+                self._init_services()
             return {'success': True, 'message': 'Authentication successful!'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
 
     def _init_services(self):
+        if self.docs_service is not None and self.drive_service is not None:
+            return
         if self.creds and self.creds.valid:
-            self.docs_service = build('docs', 'v1', credentials=self.creds)
-            self.drive_service = build('drive', 'v3', credentials=self.creds)
+            self._http = AuthorizedHttp(self.creds, http=build_http())
+            self.docs_service = build(
+                'docs', 'v1', http=self._http, static_discovery=True, cache_discovery=False
+            )
+            self.drive_service = build(
+                'drive', 'v3', http=self._http, static_discovery=True, cache_discovery=False
+            )
 
     def ensure_authenticated(self) -> bool:
-        if not self.is_authenticated():
+        with self._auth_lock:
             self._load_credentials()
-        if self.creds and self.creds.valid:
-            self._init_services()
-            return True
-        return False
+            if self.creds and self.creds.valid:
+                self._init_services()
+                return True
+            return False
 
     def list_documents(self, max_results: int = 50) -> dict:
         if not self.ensure_authenticated():
@@ -163,17 +240,50 @@ class GoogleDocsClient:
 
         try:
             doc = self.docs_service.documents().get(documentId=doc_id).execute()
-            markdown = self._doc_to_markdown(doc)
-            return {
-                'success': True,
-                'id': doc_id,
-                'title': doc.get('title', 'Untitled'),
-                'revision': doc.get('revisionId', ''),
-                'content': markdown
-            }
+            return self._document_result(doc_id, doc)
+        except HttpError as e:
+            return {'success': False, 'error': str(e)}
+
+    def get_documents(self, ids: list) -> dict:
+        if not self.ensure_authenticated():
+            return {'success': False, 'error': 'Not authenticated. Run :GDocsAuth first.'}
+
+        responses = {}
+
+        def on_response(request_id, response, exception):
+            responses[request_id] = (response, exception)
+
+        try:
+            for offset in range(0, len(ids), MAX_BATCH_SIZE):
+                batch = self.docs_service.new_batch_http_request(callback=on_response)
+                for i in range(offset, min(offset + MAX_BATCH_SIZE, len(ids))):
+                    batch.add(
+                        self.docs_service.documents().get(documentId=ids[i]),
+                        request_id=str(i)
+                    )
+                batch.execute()
+
+            documents = []
+            for i, doc_id in enumerate(ids):
+                doc, error = responses[str(i)]
+                if error is not None:
+                    documents.append({'success': False, 'id': doc_id, 'error': str(error)})
+                else:
+                    documents.append(self._document_result(doc_id, doc))
+
+            return {'success': True, 'documents': documents}
         except HttpError as e:
             return {'success': False, 'error': str(e)}
 
+    def _document_result(self, doc_id: str, doc: dict) -> dict:
+        return {
+            'success': True,
+            'id': doc_id,
+            'title': doc.get('title', 'Untitled'),
+            'revision': doc.get('revisionId', ''),
+            'content': self._doc_to_markdown(doc)
+        }
+
     def create_document(self, title: str) -> dict:
         if not self.ensure_authenticated():
             return {'success': False, 'error': 'Not authenticated. Run :GDocsAuth first.'}
@@ -193,13 +303,22 @@ class GoogleDocsClient:
             return {'success': False, 'error': 'Not authenticated. Run :GDocsAuth first.'}
 
         try:
-            doc = self.docs_service.documents().get(documentId=doc_id).execute()
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                doc_future = pool.submit(
+                    self.docs_service.documents().get(
+                        documentId=doc_id,
+                        fields='body(content(endIndex))'
+                    ).execute
+                )
+                insert_requests = self._markdown_to_requests(markdown)
+                doc = doc_future.result()
 
             body_content = doc.get('body', {}).get('content', [])
             end_index = 1
-            for element in body_content:
+            for element in reversed(body_content):
                 if 'endIndex' in element:
-                    end_index = max(end_index, element['endIndex'])
+                    end_index = element['endIndex']
+                    break
 
             requests = []
 
@@ -213,7 +332,6 @@ class GoogleDocsClient:
                     }
                 })
 
-            insert_requests = self._markdown_to_requests(markdown)
             requests.extend(insert_requests)
 
             if requests:
@@ -231,7 +349,10 @@ class GoogleDocsClient:
             return {'success': False, 'error': 'Not authenticated. Run :GDocsAuth first.'}
 
         try:
-            doc = self.docs_service.documents().get(documentId=doc_id).execute()
+            doc = self.docs_service.documents().get(
+                documentId=doc_id,
+                fields='revisionId'
+            ).execute()
             return {
                 'success': True,
                 'revision': doc.get('revisionId', '')
@@ -242,45 +363,31 @@ class GoogleDocsClient:
     def _doc_to_markdown(self, doc: dict) -> str:
         content = doc.get('body', {}).get('content', [])
         lists = doc.get('lists', {})
-        markdown_lines = []
+        out = []
+        separator = ''
 
         for element in content:
             if 'paragraph' in element:
-                para = element['paragraph']
-                md_line = self._paragraph_to_markdown(para, lists)
-                markdown_lines.append(md_line)
+                out.append(separator)
+                self._append_paragraph(element['paragraph'], lists, out)
             elif 'table' in element:
-                table_md = self._table_to_markdown(element['table'])
-                markdown_lines.append(table_md)
+                out.append(separator)
+                self._append_table(element['table'], out)
             elif 'sectionBreak' in element:
-                markdown_lines.append('\n---\n')
+                out.append(separator)
+                out.append('\n---\n')
+            else:
+                continue
+            separator = '\n'
 
-        return '\n'.join(markdown_lines)
+        return ''.join(out)
 
-    def _paragraph_to_markdown(self, para: dict, lists: dict) -> str:
+    def _append_paragraph(self, para: dict, lists: dict, out: list):
         style = para.get('paragraphStyle', {}).get('namedStyleType', 'NORMAL_TEXT')
         bullet = para.get('bullet')
         elements = para.get('elements', [])
 
-        text_parts = []
-        for elem in elements:
-            if 'textRun' in elem:
-                text_parts.append(self._text_run_to_markdown(elem['textRun']))
-
-        text = ''.join(text_parts).rstrip('\n')
-
-        heading_map = {
-            'HEADING_1': '# ',
-            'HEADING_2': '## ',
-            'HEADING_3': '### ',
-            'HEADING_4': '#### ',
-            'HEADING_5': '##### ',
-            'HEADING_6': '###### ',
-            'TITLE': '# ',
-            'SUBTITLE': '## ',
-        }
-
-        prefix = heading_map.get(style, '')
+        prefix = _HEADING_PREFIX.get(style, '')
 
         if bullet:
             list_id = bullet.get('listId')
@@ -292,69 +399,93 @@ class GoogleDocsClient:
 
             if nesting_levels and nesting_level < len(nesting_levels):
                 glyph_type = nesting_levels[nesting_level].get('glyphType', '')
-                if glyph_type in ('DECIMAL', 'ALPHA', 'ROMAN'):
+                if glyph_type in _ORDERED_GLYPHS:
                     prefix = f'{indent}1. '
                 else:
                     prefix = f'{indent}- '
             else:
                 prefix = f'{indent}- '
 
-        return prefix + text
+        out.append(prefix)
+        start = len(out)
 
-    def _text_run_to_markdown(self, text_run: dict) -> str:
+        for elem in elements:
+            if 'textRun' in elem:
+                self._append_text_run(elem['textRun'], out)
+
+        while len(out) > start and out[-1].endswith('\n'):
+            text = out.pop().rstrip('\n')
+            if text:
+                out.append(text)
+                break
+
+    def _append_text_run(self, text_run: dict, out: list):
         content = text_run.get('content', '')
-        style = text_run.get('textStyle', {})
 
-        if not content or content == '\n':
-            return content
+        if not content:
+            return
+
+        if content == '\n':
+            out.append(content)
+            return
 
         trailing_newline = content.endswith('\n')
         content = content.rstrip('\n')
 
-        if not content:
-            return '\n' if trailing_newline else ''
+        if content:
+            opening, closing = self._text_style_markers(text_run.get('textStyle', {}))
+            out.append(opening)
+            out.append(content)
+            out.append(closing)
+
+        if trailing_newline:
+            out.append('\n')
+
+    def _text_style_markers(self, style: dict) -> tuple[str, str]:
+        opening = ''
+        closing = ''
 
         if style.get('bold'):
-            content = f'**{content}**'
+            opening = closing = '**'
         if style.get('italic'):
-            content = f'*{content}*'
+            opening = '*' + opening
+            closing += '*'
         if style.get('strikethrough'):
-            content = f'~~{content}~~'
+            opening = '~~' + opening
+            closing += '~~'
         if style.get('link', {}).get('url'):
-            url = style['link']['url']
-            content = f'[{content}]({url})'
+            opening = '[' + opening
+            closing += f"]({style['link']['url']})"
 
-        if trailing_newline:
-            content += '\n'
-
-        return content
+        return opening, closing
 
-    def _table_to_markdown(self, table: dict) -> str:
+    def _append_table(self, table: dict, out: list):
         rows = table.get('tableRows', [])
-        if not rows:
-            return ''
 
-        md_rows = []
         for i, row in enumerate(rows):
             cells = row.get('tableCells', [])
             cell_texts = []
             for cell in cells:
                 cell_content = cell.get('content', [])
-                text = ''
+                text_parts = []
                 for elem in cell_content:
                     if 'paragraph' in elem:
                         for pe in elem['paragraph'].get('elements', []):
                             if 'textRun' in pe:
-                                text += pe['textRun'].get('content', '').strip()
-                cell_texts.append(text.replace('|', '\\|'))
+                                text_parts.append(pe['textRun'].get('content', '').strip())
+                text = ''.join(text_parts)
+                cell_texts.append(text.translate(_PIPE_ESCAPE))
 
-            md_rows.append('| ' + ' | '.join(cell_texts) + ' |')
+            if i > 0:
+                out.append('\n')
+            out.append('| ')
+            out.append(' | '.join(cell_texts))
+            out.append(' |')
 
             if i == 0:
-                separator = '| ' + ' | '.join(['---'] * len(cell_texts)) + ' |'
-                md_rows.append(separator)
-
-        return '\n'.join(md_rows)
+                out.append('\n| ')
+                out.append(' | '.join(['---'] * len(cell_texts)))
+                out.append(' |')
 
     def _markdown_to_requests(self, markdown: str) -> list:
         requests = []
@@ -369,14 +500,16 @@ class GoogleDocsClient:
             prefix = ''
             style_type = None
 
-            heading_match = re.match(r'^(#{1,6})\s+(.*)$', line)
-            if heading_match:
-                level = len(heading_match.group(1))
-                line = heading_match.group(2)
-                style_type = f'HEADING_{level}'
+            if line[:1] == '#':
+                heading_match = _HEADING_RE.match(line)
+                if heading_match:
+                    level = len(heading_match.group(1))
+                    line = heading_match.group(2)
+                    style_type = f'HEADING_{level}'
 
-            bullet_match = re.match(r'^(\s*)[-*]\s+(.*)$', line)
-            numbered_match = re.match(r'^(\s*)\d+\.\s+(.*)$', line)
+            first = line.lstrip()[:1]
+            bullet_match = _BULLET_RE.match(line) if first in ('-', '*') else None
+            numbered_match = _NUMBERED_RE.match(line) if first.isdigit() else None
 
             if bullet_match:
                 indent = len(bullet_match.group(1)) // 2
@@ -387,19 +520,22 @@ class GoogleDocsClient:
                 line = numbered_match.group(2)
                 prefix = '1. '
 
-            processed_line, inline_formats = self._process_inline_markdown(line)
-            full_line = prefix + processed_line + '\n'
+            if prefix:
+                line = prefix + line
+
+            if _INLINE_DELIMS.isdisjoint(line):
+                inline_formats = []
+            else:
+                line, inline_formats = self._process_inline_markdown(line)
+            full_line = line + '\n'
 
             start_index = current_index
             text_to_insert.append(full_line)
 
-            prefix_len = len(prefix)
             for fmt in inline_formats:
-                formatting_requests.append({
-                    'start': start_index + prefix_len + fmt['start'],
-                    'end': start_index + prefix_len + fmt['end'],
-                    'style': fmt['style']
-                })
+                fmt['start'] += start_index
+                fmt['end'] += start_index
+                formatting_requests.append(fmt)
 
             if style_type:
                 formatting_requests.append({
@@ -410,6 +546,8 @@ class GoogleDocsClient:
 
             current_index += len(full_line)
 
+        formatting_requests = self._merge_format_ranges(formatting_requests)
+
         full_text = ''.join(text_to_insert)
         if full_text:
             requests.append({
@@ -437,15 +575,11 @@ class GoogleDocsClient:
                 update_style = {}
                 fields = []
 
-                if fmt['style'] == 'bold':
-                    update_style['bold'] = True
-                    fields.append('bold')
-                elif fmt['style'] == 'italic':
-                    update_style['italic'] = True
-                    fields.append('italic')
-                elif fmt['style'] == 'strikethrough':
-                    update_style['strikethrough'] = True
-                    fields.append('strikethrough')
+                style_field = _STYLE_FIELDS.get(fmt['style'])
+                if style_field:
+                    field, value = style_field
+                    update_style[field] = value
+                    fields.append(field)
                 elif fmt['style'].startswith('link:'):
                     url = fmt['style'][5:]
                     update_style['link'] = {'url': url}
@@ -465,68 +599,110 @@ class GoogleDocsClient:
 
         return requests
 
+    def _merge_format_ranges(self, formats: list) -> list:
+        groups = {}
+        for fmt in formats:
+            key = (fmt.get('paragraph_style'), fmt.get('style'))
+            groups.setdefault(key, []).append(fmt)
+
+        merged = []
+        for group in groups.values():
+            group.sort(key=lambda fmt: fmt['start'])
+            current = group[0]
+            for fmt in group[1:]:
+                if fmt['start'] <= current['end']:
+                    current['end'] = max(current['end'], fmt['end'])
+                else:
+                    merged.append(current)
+                    current = fmt
+            merged.append(current)
+
+        return merged
+
     def _process_inline_markdown(self, text: str) -> tuple[str, list]:
+        out = []
         formats = []
-        result = text
-        offset = 0
-
-        for match in re.finditer(r'\*\*(.+?)\*\*', text):
-            start = match.start() - offset
-            content = match.group(1)
-            end = start + len(content)
-            result = result[:start] + content + result[start + len(match.group(0)):]
-            formats.append({'start': start, 'end': end, 'style': 'bold'})
-            offset += 4
-
-        text = result
-        offset = 0
-        for match in re.finditer(r'(?<!\*)\*([^*]+?)\*(?!\*)', text):
-            start = match.start() - offset
-            content = match.group(1)
-            end = start + len(content)
-            result = result[:start] + content + result[start + len(match.group(0)):]
-            formats.append({'start': start, 'end': end, 'style': 'italic'})
-            offset += 2
-
-        text = result
-        offset = 0
-        for match in re.finditer(r'~~(.+?)~~', text):
-            start = match.start() - offset
-            content = match.group(1)
-            end = start + len(content)
-            result = result[:start] + content + result[start + len(match.group(0)):]
-            formats.append({'start': start, 'end': end, 'style': 'strikethrough'})
-            offset += 4
-
-        text = result
-        offset = 0
-        for match in re.finditer(r'\[([^\]]+)\]\(([^)]+)\)', text):
-            start = match.start() - offset
-            link_text = match.group(1)
-            url = match.group(2)
-            end = start + len(link_text)
-            result = result[:start] + link_text + result[start + len(match.group(0)):]
-            formats.append({'start': start, 'end': end, 'style': f'link:{url}'})
-            offset += len(match.group(0)) - len(link_text)
-
-        return result, formats
+        out_len = 0
+        last = 0
+        i = 0
+        n = len(text)
+
+        while i < n:
+            pair = text[i:i + 2]
+            inner = None
+
+            if pair == '**':
+                end = text.find('**', i + 3)
+                if end != -1:
+                    if text[i + 2] == '*' and text[end + 2:end + 3] == '*':
+                        end += 1
+                    inner, style, close = text[i + 2:end], 'bold', end + 2
+            elif pair == '~~':
+                end = text.find('~~', i + 3)
+                if end != -1:
+                    inner, style, close = text[i + 2:end], 'strikethrough', end + 2
+            elif text[i] == '*' and (i == 0 or text[i - 1] != '*'):
+                end = text.find('*', i + 1)
+                while end != -1 and (text[end - 1] == '*' or text[end + 1:end + 2] == '*'):
+                    end = text.find('*', end + 1)
+                if end > i + 1:
+                    inner, style, close = text[i + 1:end], 'italic', end + 1
+            elif text[i] == '[':
+                end = text.find(']', i + 1)
+                if end > i + 1 and text[end + 1:end + 2] == '(':
+                    url_end = text.find(')', end + 2)
+                    if url_end > end + 2:
+                        inner, style, close = text[i + 1:end], f'link:{text[end + 2:url_end]}', url_end + 1
+
+            if inner is None:
+                i += 1
+                continue
+
+            if last < i:
+                out.append(text[last:i])
+                out_len += i - last
+
+            inner_text, inner_formats = self._process_inline_markdown(inner)
+            formats.append({'start': out_len, 'end': out_len + len(inner_text), 'style': style})
+            for fmt in inner_formats:
+                fmt['start'] += out_len
+                fmt['end'] += out_len
+            formats.extend(inner_formats)
+            out.append(inner_text)
+            out_len += len(inner_text)
+            i = last = close
+
+        if last == 0:
+            return text, formats
+
+        out.append(text[last:])
+        return ''.join(out), formats
 
 
 class RPCServer:
 
     def __init__(self):
         self.client = GoogleDocsClient()
+        self._stdout = sys.stdout.buffer
         self.methods = {
             'auth': self.client.authenticate,
             'is_authenticated': lambda: {'authenticated': self.client.is_authenticated()},
             'list': self.client.list_documents,
             'get': self.client.get_document,
+            'get_many': self.client.get_documents,
             'create': self.client.create_document,
             'update': self.client.update_document,
             'revision': self.client.get_revision,
             'ping': lambda: {'pong': True},
             'data_dir': lambda: {'path': str(DATA_DIR)},
         }
+        threading.Thread(target=self._warm_up, daemon=True).start()
+
+    def _warm_up(self):
+        try:
+            self.client.ensure_authenticated()
+        except Exception:
+            pass
 
     def handle_request(self, request: dict) -> dict:
         method = request.get('method', '')
@@ -554,32 +730,48 @@ class RPCServer:
                 'error': {'code': -32603, 'message': str(e)}
             }
 
+    def _read_message(self, stream) -> Optional[bytes]:
+        length = None
+        while True:
+            header = stream.readline()
+            if not header:
+                return None
+
+            header = header.strip()
+            if not header:
+                if length is not None:
+                    break
+                continue
+
+            name, _, value = header.partition(b':')
+            if name.strip().lower() == b'content-length':
+                length = int(value)
+
+        return stream.read(length)
+
+    def _send(self, obj: Any):
+        body = _json_dumps(obj)
+        self._stdout.write(b'Content-Length: %d\r\n\r\n' % len(body))
+        self._stdout.write(body)
+        self._stdout.flush()
+
     def run(self):
+        stdin = sys.stdin.buffer
         while True:
             try:
-                line = sys.stdin.readline()
-                if not line:
+                body = self._read_message(stdin)
+                if body is None:
                     break
 
-                request = json.loads(line)
-                response = self.handle_request(request)
-
-                sys.stdout.write(json.dumps(response) + '\n')
-                sys.stdout.flush()
+                request = _json_loads(body)
+                self._send(self.handle_request(request))
             except json.JSONDecodeError:
-                error_response = {
-                    'id': None,
-                    'error': {'code': -32700, 'message': 'Parse error'}
-                }
-                sys.stdout.write(json.dumps(error_response) + '\n')
-                sys.stdout.flush()
+                self._send(_PARSE_ERROR_RESPONSE)
             except Exception as e:
-                error_response = {
+                self._send({
                     'id': None,
                     'error': {'code': -32603, 'message': str(e)}
-                }
-                sys.stdout.write(json.dumps(error_response) + '\n')
-                sys.stdout.flush()
+                })
 
 
 def main():